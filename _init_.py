@@ -22,10 +22,13 @@ addon_updater_ops.update_settings(
 )
 
 import bpy
+import bmesh
 from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import StringProperty, EnumProperty, FloatProperty, PointerProperty, BoolProperty
+from bpy.props import StringProperty, EnumProperty, FloatProperty, IntProperty, PointerProperty, BoolProperty
+from collections import namedtuple
 from math import radians, pi, asin
-from mathutils import Vector
+from mathutils import Vector, Matrix
+import numpy as np
 
 def draw_updater_ui(self, context):
     layout = self.layout
@@ -35,63 +38,265 @@ def draw_updater_ui(self, context):
 # Helpers
 # ---------------------------
 
+_UNIT_FACTOR = {"mm": 1e-3, "cm": 1e-2, "m": 1.0}
+
 def _to_meters(value: float, unit: str = "m") -> float:
-    unit = (unit or "m").lower()
-    if unit == "mm": return value / 1000.0
-    if unit == "cm": return value / 100.0
-    return value
+    return value * _UNIT_FACTOR.get(unit.lower() if unit else "m", 1.0)
+
+def _asin(x: float) -> float:
+    # Short series for tiny chords (error < 1e-16 below 1e-3), libm otherwise
+    if abs(x) < 1e-3: return x + x * x * x / 6.0
+    return asin(x)
+
+def _apparent_width_scale(p) -> float:
+    # X scale that makes the wrapped SVG's front-view width equal its flat
+    # width, from the current cylinder settings (1.0 when disabled/invalid)
+    R = _to_meters(p.cyl_outer_r, p.cyl_unit)
+    W_orig = p.svg_orig_x
+    # Guard: chord can't exceed diameter
+    if not p.preserve_apparent_width or W_orig <= 0 or R <= 0 or W_orig >= 2.0 * R:
+        return 1.0
+    # Find arc length L_target so chord = W_orig  =>  W_orig = 2R sin(L/(2R))
+    # => L_target = 2R * asin(W_orig / (2R))
+    L_target = 2.0 * R * _asin(W_orig / (2.0 * R))
+    return L_target / W_orig
 
 def _ensure_subsurf(obj, name="CYLSVG_Subd", levels=2):
     mod = obj.modifiers.get(name)
     if not mod:
         mod = obj.modifiers.new(name, 'SUBSURF')
-    mod.levels = int(max(1, levels))
+    mod.levels = max(1, levels)
     mod.render_levels = mod.levels
     mod.subdivision_type = 'SIMPLE'
+    # Simple subdivision is already flat; skip the limit-surface evaluation
+    mod.use_limit_surface = False
     return mod
 
+# Cube faces as (fixed axis, fixed at max?, u axis, v axis) with u x v outward
+_CUBE_FACES = (
+    (0, True, 1, 2), (0, False, 2, 1),
+    (1, True, 2, 0), (1, False, 0, 2),
+    (2, True, 0, 1), (2, False, 1, 0),
+)
+
+def _grid_cube_mesh(name, size, segments):
+    # Build a box of the given size whose faces are regular quad grids, i.e.
+    # what a Simple subsurf of a cube produces, without the modifier stack.
+    # int32/float32 throughout: at level 10 (m=1024) there are 6.3M verts
+    # and 25M loops, and (m+1)^3 lattice keys still fit in int32.
+    m = int(segments)
+    nf = len(_CUBE_FACES)
+    a, b = np.meshgrid(np.arange(m + 1, dtype=np.int32), np.arange(m + 1, dtype=np.int32), indexing='ij')
+    a, b = a.ravel(), b.ravel()
+    ga = np.arange(m, dtype=np.int32)
+    ca, cb = np.meshgrid(ga, ga, indexing='ij')
+    cell = (ca * (m + 1) + cb).ravel()
+    grid_quads = np.stack((cell, cell + m + 1, cell + m + 2, cell + 1), axis=1)
+
+    lattice = np.empty((nf * len(a), 3), dtype=np.int32)
+    quads = np.empty((nf * len(grid_quads), 4), dtype=np.int32)
+    for f, (axis, at_max, u, v) in enumerate(_CUBE_FACES):
+        pts = lattice[f * len(a):(f + 1) * len(a)]
+        pts[:, axis] = m if at_max else 0
+        pts[:, u] = a
+        pts[:, v] = b
+        np.add(grid_quads, f * len(a), out=quads[f * len(grid_quads):(f + 1) * len(grid_quads)])
+
+    # Per-loop UVs: each face's grid unwrapped into its own tile of a 3x2
+    # atlas, filled face by face into one preallocated float32 buffer
+    face_uv = np.stack((a[grid_quads], b[grid_quads]), axis=-1).astype(np.float32)
+    face_uv /= m
+    uv_scale = np.array((1.0 / 3.0, 0.5), dtype=np.float32)
+    uvs = np.empty((quads.size, 2), dtype=np.float32)
+    for f in range(nf):
+        face = uvs[f * face_uv.shape[0] * 4:(f + 1) * face_uv.shape[0] * 4].reshape(face_uv.shape)
+        np.add(face_uv, np.array((f % 3, f // 3), dtype=np.float32), out=face)
+        face *= uv_scale
+    del face_uv
+
+    # Weld the shared edge/corner vertices between faces
+    keys = (lattice[:, 0] * (m + 1) + lattice[:, 1]) * (m + 1) + lattice[:, 2]
+    keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    co = lattice[first].astype(np.float32)
+    co *= np.asarray(size, dtype=np.float32) / m
+    co -= np.asarray(size, dtype=np.float32) / 2
+    loops = inverse.ravel().astype(np.int32)[quads].ravel()
+    del lattice, keys, first, inverse
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set('co', co.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set('vertex_index', loops)
+    mesh.polygons.add(len(quads))
+    mesh.polygons.foreach_set('loop_start', np.arange(0, len(loops), 4, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set('loop_total', np.full(len(quads), 4, dtype=np.int32))
+    mesh.uv_layers.new(name="UVMap").data.foreach_set('uv', uvs.ravel())
+    mesh.update(calc_edges=True)
+    return mesh
+
 def _apply_modifiers(obj):
-    if obj is None: return
-    ctx = bpy.context
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    ctx.view_layer.objects.active = obj
-    for m in list(obj.modifiers):
-        try:
-            bpy.ops.object.modifier_apply(modifier=m.name)
-        except Exception:
-            pass
-
-def _world_bbox(obj):
-    return [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-
-def _world_bbox_min_max_z(obj):
-    zs = [c.z for c in _world_bbox(obj)]
-    return min(zs), max(zs)
-
-def _world_bbox_center_xy(obj):
-    coords = _world_bbox(obj)
-    c = Vector((0.0,0.0,0.0))
-    for p in coords: c += p
-    c /= 8.0
-    return c.x, c.y
+    # Bake the whole modifier stack in one depsgraph evaluation instead of
+    # one modifier_apply (eval + undo push + mesh rebuild) per modifier.
+    if obj is None or not obj.modifiers: return
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    new_mesh = bpy.data.meshes.new_from_object(eval_obj)
+    old_mesh = obj.data
+    name = old_mesh.name
+    obj.modifiers.clear()
+    obj.data = new_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    new_mesh.name = name
+
+def _run(op, obj, selected=None, **kw):
+    # Run an object operator against a synthesized context instead of
+    # mutating the scene-wide selection / active object.
+    selected = list(selected) if selected else [obj]
+    with bpy.context.temp_override(object=obj, active_object=obj,
+                                   selected_objects=selected,
+                                   selected_editable_objects=selected):
+        return op(**kw)
+
+def _curves_to_meshes(objs):
+    # Data-level replacement for bpy.ops.object.convert(target='MESH').
+    # Every curve is evaluated from one depsgraph before the scene is touched,
+    # so linking/removing objects doesn't force a re-evaluation per curve.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    meshes = [bpy.data.meshes.new_from_object(o.evaluated_get(depsgraph)) for o in objs]
+    result = []
+    for obj, mesh in zip(objs, meshes):
+        name = obj.name
+        new = bpy.data.objects.new(name + "_mesh", mesh)
+        new.matrix_world = obj.matrix_world.copy()
+        for coll in obj.users_collection:
+            coll.objects.link(new)
+        bpy.data.objects.remove(obj, do_unlink=True)
+        new.name = name
+        result.append(new)
+    return result
+
+def _world_bbox_all(obj, local_scale=None):
+    # All 8 bound_box corners in world space as an (8,3) array, one matmul.
+    # local_scale accounts for vertex scaling not yet reflected in bound_box.
+    corners = np.ones((8, 4))
+    corners[:, :3] = np.asarray(obj.bound_box, dtype=np.float64)
+    if local_scale is not None:
+        corners[:, :3] *= local_scale
+    return (corners @ np.asarray(obj.matrix_world, dtype=np.float64).T)[:, :3]
 
 def _world_bbox_size(obj):
-    coords = _world_bbox(obj)
-    xs = [c.x for c in coords]; ys = [c.y for c in coords]; zs = [c.z for c in coords]
-    return (max(xs)-min(xs), max(ys)-min(ys), max(zs)-min(zs))
-
-def _move_by(obj, dx=0.0, dy=0.0, dz=0.0):
-    obj.location.x += dx
-    obj.location.y += dy
-    obj.location.z += dz
+    size = np.ptp(_world_bbox_all(obj), axis=0)
+    return tuple(float(v) for v in size)
+
+_BBoxStats = namedtuple("_BBoxStats", "cx cy min_z max_z size_x size_y size_z")
+
+def _world_bbox_stats(obj, local_scale=None):
+    # Center XY, Z range and size from a single batched world transform
+    world = _world_bbox_all(obj, local_scale)
+    lo, hi = world.min(axis=0), world.max(axis=0)
+    c = world.mean(axis=0)
+    return _BBoxStats(float(c[0]), float(c[1]), float(lo[2]), float(hi[2]),
+                     *(float(v) for v in hi - lo))
+
+def _read_co(mesh):
+    # Vertex coords as an (N,3) float32 array, one foreach_get bulk copy
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    return co.reshape(-1, 3)
+
+def _write_co(mesh, co):
+    # Flush an (N,3) coord array back with one foreach_set + update
+    mesh.vertices.foreach_set('co', np.ascontiguousarray(co, dtype=np.float32).ravel())
+    mesh.update()
+
+def _center_origin(obj):
+    # Move the origin to the vertex centroid without the origin_set operator
+    mesh = obj.data
+    if not mesh.vertices: return
+    co = _read_co(mesh)
+    c = co.mean(axis=0)
+    co -= c
+    _write_co(mesh, co)
+    obj.location += obj.matrix_basis.to_3x3() @ Vector(c)
+
+def _rotate_y180(obj):
+    # 180° about local Y is a sign flip of X and Z; bake it into the verts
+    co = _read_co(obj.data)
+    co[:, 0::2] *= -1.0
+    _write_co(obj.data, co)
+
+def _apply_transform(obj):
+    # transform_apply(location, rotation, scale) without the operator
+    obj.data.transform(obj.matrix_basis)
+    obj.matrix_basis = Matrix.Identity(4)
+    obj.data.update()
+
+def _scale_x(obj, s):
+    # Scale mesh vertices along local X in place (same as obj.scale.x *= s)
+    co = _read_co(obj.data)
+    co[:, 0] *= s
+    _write_co(obj.data, co)
+
+def _bend_z(obj, angle):
+    # Closed-form SIMPLE_DEFORM / BEND about Z (default 0..1 limits, no
+    # origin), baked straight into the vertex coords: the factor is spread
+    # over the local X extent and each vertex is wrapped around Y = 1/k.
+    mesh = obj.data
+    if not mesh.vertices: return
+    co = _read_co(mesh).astype(np.float64)
+    span = co[:, 0].max() - co[:, 0].min()
+    if span <= 0.0 or abs(angle) <= 1e-7: return
+    k = angle / span
+    theta = co[:, 0] * k
+    r = co[:, 1] - 1.0 / k
+    co[:, 0] = -r * np.sin(theta)
+    co[:, 1] = r * np.cos(theta) + 1.0 / k
+    _write_co(mesh, co)
+
+def _join_into(dest, src, offset=None):
+    # Merge src's mesh into dest with bmesh instead of bpy.ops.object.join.
+    # offset is a pending world-space move of src, folded into the transform
+    # so src.location never has to be written and re-evaluated.
+    src_world = src.matrix_world
+    if offset is not None:
+        src_world = Matrix.Translation(offset) @ src_world
+    mesh = src.data.copy()
+    mesh.transform(dest.matrix_world.inverted() @ src_world)
+
+    # Carry src materials over to dest and remap face material indices
+    slots = []
+    for mat in mesh.materials:
+        if mat not in dest.data.materials[:]:
+            dest.data.materials.append(mat)
+        slots.append(dest.data.materials[:].index(mat))
+    if slots and mesh.polygons:
+        idx = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get('material_index', idx)
+        idx = np.asarray(slots, dtype=np.int32)[np.clip(idx, 0, len(slots) - 1)]
+        mesh.polygons.foreach_set('material_index', idx)
+
+    bm = bmesh.new()
+    bm.from_mesh(dest.data)
+    bm.from_mesh(mesh)
+    bm.to_mesh(dest.data)
+    bm.free()
+    dest.data.update()
+
+    bpy.data.meshes.remove(mesh)
+    bpy.data.objects.remove(src, do_unlink=True)
 
 # ---------------------------
 # Properties
 # ---------------------------
 
+_UNIT_ITEMS = (("mm","mm",""),("cm","cm",""),("m","m",""))
+
 def _poll_mesh(self, obj):
-    return obj and obj.type == 'MESH'
+    # poll is only called with real objects, so the type tag alone suffices
+    return obj.type == 'MESH'
 
 class CYLSVG_Props(PropertyGroup):
     # object references
@@ -100,18 +305,20 @@ class CYLSVG_Props(PropertyGroup):
 
     # store original planar X of SVG (meters) at import
     svg_orig_x: FloatProperty(name="Orig SVG X", default=0.0, min=0.0)
+    # X pre-compression already baked into the SVG mesh at import
+    svg_x_scale: FloatProperty(name="SVG X Scale", default=1.0, min=0.0)
 
     # SVG solidify
     thk_value: FloatProperty(name="Thickness", default=2.0, min=0.0, precision=4)
-    thk_unit: EnumProperty(name="Unit", items=[("mm","mm",""),("cm","cm",""),("m","m","")], default="mm")
+    thk_unit: EnumProperty(name="Unit", items=_UNIT_ITEMS, default="mm")
 
     # Cylinder inputs (global unit)
     cyl_outer_r: FloatProperty(name="Outer Radius", default=0.050, min=0.0, precision=4)
     cyl_inner_r: FloatProperty(name="Inner Radius", default=0.040, min=0.0, precision=4)
     cyl_height:  FloatProperty(name="Height", default=0.100, min=0.0, precision=4)
-    cyl_unit: EnumProperty(name="Unit", items=[("mm","mm",""),("cm","cm",""),("m","m","")], default="mm")
+    cyl_unit: EnumProperty(name="Unit", items=_UNIT_ITEMS, default="mm")
 
-    cyl_subdiv: FloatProperty(name="Subdivisions", default=7.0, min=1.0, max=10.0, precision=0)
+    cyl_subdiv: IntProperty(name="Subdivisions", default=7, min=1, max=10)
 
     # Appearance correction
     preserve_apparent_width: BoolProperty(
@@ -134,10 +341,12 @@ class CYLSVG_OT_ImportSVG(Operator):
 
     def execute(self, context):
         props = context.scene.cylsvg_props
-        try:
-            bpy.ops.preferences.addon_enable(module="io_curve_svg")
-        except Exception:
-            pass
+        # Only enable the importer when it isn't already (live prefs state)
+        if "io_curve_svg" not in context.preferences.addons:
+            try:
+                bpy.ops.preferences.addon_enable(module="io_curve_svg")
+            except Exception:
+                pass
 
         pre = set(o.name for o in bpy.data.objects)
         res = bpy.ops.import_curve.svg(filepath=self.filepath)
@@ -145,54 +354,47 @@ class CYLSVG_OT_ImportSVG(Operator):
             self.report({'ERROR'}, "SVG import cancelled or failed.")
             return {'CANCELLED'}
 
-        context.view_layer.update()
         new_objs = [o for o in bpy.data.objects if o.name not in pre and o.type in {'CURVE','MESH'}]
         if not new_objs:
             self.report({'ERROR'}, "No SVG objects found.")
             return {'CANCELLED'}
 
-        bpy.ops.object.select_all(action='DESELECT')
-        for o in new_objs: o.select_set(True)
-        context.view_layer.objects.active = new_objs[0]
-
-        if any(o.type == 'CURVE' for o in new_objs):
-            bpy.ops.object.convert(target='MESH', keep_original=False)
-
-        meshes = [o for o in context.selected_objects if o.type == 'MESH']
+        # Convert in place so meshes[0] (the join target) keeps import order
+        is_curve = [o.type == 'CURVE' for o in new_objs]
+        converted = iter(_curves_to_meshes([o for o, c in zip(new_objs, is_curve) if c]))
+        meshes = [next(converted) if c else o for o, c in zip(new_objs, is_curve)]
         if not meshes:
             self.report({'ERROR'}, "Conversion failed.")
             return {'CANCELLED'}
 
+        flat = meshes[0]
         if len(meshes) > 1:
-            bpy.ops.object.join()
-            
-        flat = context.view_layer.objects.active
+            _run(bpy.ops.object.join, flat, selected=meshes)
+
         flat.name = "SVG_Flat"
 
         # Rotate SVG 180° around Y axis before applying modifiers
-        flat.rotation_euler[1] = radians(180.0)
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+        _rotate_y180(flat)
+
+        # One evaluation for conversion + join + rotation so bound_box is current
+        context.view_layer.update()
 
         # store original planar X at import
         props.svg_orig_x = _world_bbox_size(flat)[0]
 
-        # Solidify
+        # Pre-compress in X for the current cylinder while the mesh is still 2D
+        props.svg_x_scale = _apparent_width_scale(props)
+        if props.svg_x_scale != 1.0:
+            _scale_x(flat, props.svg_x_scale)
+
+        # Solidify + light subdiv, baked together in a single evaluation
         mod = flat.modifiers.new("CYLSVG_Thickness", 'SOLIDIFY')
         mod.thickness = _to_meters(props.thk_value, props.thk_unit)
-        _apply_modifiers(flat)
-
-        # Light subdiv (apply)
         _ensure_subsurf(flat, "CYLSVG_Subd", 4)
         _apply_modifiers(flat)
 
-        # Origin to volume
-        bpy.ops.object.select_all(action='DESELECT')
-        flat.select_set(True)
-        context.view_layer.objects.active = flat
-        try:
-            bpy.ops.object.origin_set(type='ORIGIN_CENTER_OF_VOLUME', center='MEDIAN')
-        except Exception:
-            pass
+        # Origin to vertex centroid (stands in for ORIGIN_CENTER_OF_VOLUME)
+        _center_origin(flat)
 
         props.flat_obj = flat
         self.report({'INFO'}, "SVG imported and converted to mesh.")
@@ -224,13 +426,15 @@ class CYLSVG_OT_AddCubeFromCylinder(Operator):
         Y = height
         Z = outer - inner     # wall thickness
 
-        bpy.ops.mesh.primitive_cube_add(size=1.0, align='WORLD', location=(0,0,0))
-        cube = context.view_layer.objects.active
-        cube.name = "CYLSVG_Cube"
-        cube.dimensions = (X, Y, Z)
-
-        _ensure_subsurf(cube, "CYLSVG_CubeSubd", int(p.cyl_subdiv))
-        _apply_modifiers(cube)
+        # Simple subsurf at level n == 2^n x 2^n grid per cube face
+        mesh = _grid_cube_mesh("CYLSVG_Cube", (X, Y, Z), 2 ** p.cyl_subdiv)
+        cube = bpy.data.objects.new("CYLSVG_Cube", mesh)
+        context.collection.objects.link(cube)
+        # Same selection result as primitive_cube_add: only the new cube
+        for o in context.selected_objects:
+            o.select_set(False)
+        cube.select_set(True)
+        context.view_layer.objects.active = cube
         p.cube_obj = cube
 
         self.report({'INFO'}, f"Cylinder→Cube: X={X:.3f}m, Y={Y:.3f}m, Z={Z:.3f}m (applied).")
@@ -248,39 +452,32 @@ class CYLSVG_OT_PlaceSvgOnCubeTopJoin(Operator):
             self.report({'ERROR'}, "SVG or Cube not set.")
             return {'CANCELLED'}
 
-        # Optional apparent-width preservation: pre-compress in X
-        if p.preserve_apparent_width and p.svg_orig_x > 0:
-            R = _to_meters(p.cyl_outer_r, p.cyl_unit)
-            W_orig = p.svg_orig_x
-            # Guard: chord can't exceed diameter
-            max_chord = 2.0 * R
-            if W_orig < max_chord and R > 0:
-                # Find arc length L_target so chord = W_orig  =>  W_orig = 2R sin(L/(2R))
-                # => L_target = 2R * asin(W_orig / (2R))
-                L_target = 2.0 * R * asin(W_orig / (2.0 * R))
-                cur_X = _world_bbox_size(flat)[0]
-                if cur_X > 0:
-                    flat.scale.x *= (L_target / cur_X)
-                    context.view_layer.update()
-
-        # Align XY centers
-        cx, cy = _world_bbox_center_xy(cube)
-        sx, sy = _world_bbox_center_xy(flat)
-        _move_by(flat, dx=(cx - sx), dy=(cy - sy), dz=0.0)
-
-        # Sit on top Z
-        _, cube_top_z = _world_bbox_min_max_z(cube)
-        svg_min_z, _ = _world_bbox_min_max_z(flat)
-        _move_by(flat, dz=(cube_top_z - svg_min_z))
+        # bound_box is only refreshed by an evaluation; objects built or edited
+        # at data level (generated cube, centered SVG) may not have had one yet
+        context.view_layer.update()
+
+        cube_bb = _world_bbox_stats(cube)
+        flat_bb = _world_bbox_stats(flat)
+
+        # Apparent-width pre-compression is baked at import; only correct the
+        # (heavier, solidified) mesh if the settings changed since then
+        target = _apparent_width_scale(p)
+        if p.svg_x_scale > 0 and abs(target / p.svg_x_scale - 1.0) > 1e-6:
+            s = target / p.svg_x_scale
+            _scale_x(flat, s)
+            flat_bb = _world_bbox_stats(flat, (s, 1.0, 1.0))
+            p.svg_x_scale = target
+
+        # Align XY centers and sit on top Z, as one offset applied at join
+        offset = Vector((cube_bb.cx - flat_bb.cx,
+                         cube_bb.cy - flat_bb.cy,
+                         cube_bb.max_z - flat_bb.min_z))
 
         # Join
-        bpy.ops.object.select_all(action='DESELECT')
-        cube.select_set(True); flat.select_set(True)
-        context.view_layer.objects.active = cube
-        bpy.ops.object.join()
+        _join_into(cube, flat, offset)
 
         p.flat_obj = None
-        p.cube_obj = context.view_layer.objects.active
+        p.cube_obj = cube
         self.report({'INFO'}, "SVG aligned on cube and joined.")
         return {'FINISHED'}
 
@@ -296,18 +493,10 @@ class CYLSVG_OT_Cylindrify(Operator):
             self.report({'ERROR'}, "No cube object found.")
             return {'CANCELLED'}
 
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-
         obj.rotation_euler.x += radians(90.0)
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+        _apply_transform(obj)
 
-        mod = obj.modifiers.new("CYLSVG_Bend", 'SIMPLE_DEFORM')
-        mod.deform_method = 'BEND'
-        mod.deform_axis = 'Z'
-        mod.factor = radians(361.0)
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        _bend_z(obj, radians(361.0))
 
         self.report({'INFO'}, "Cylindrified (361° bend applied).")
         return {'FINISHED'}
@@ -328,14 +517,7 @@ class CYLSVG_PT_Main(Panel):
 
         p = context.scene.cylsvg_props
 
-        # Import
-        box = layout.box()
-        box.label(text="Import SVG", icon="IMPORT")
-        row = box.row(align=True)
-        row.prop(p, "thk_value"); row.prop(p, "thk_unit", text="")
-        box.operator("cylsvg.import_svg", icon="IMPORT")
-
-        # Cylinder dimensions
+        # Cylinder dimensions (first: import pre-compresses for this radius)
         cyl_box = layout.box()
         cyl_box.label(text="Cylinder Dimensions", icon="MESH_CUBE")
         col = cyl_box.column(align=True)
@@ -347,12 +529,19 @@ class CYLSVG_PT_Main(Panel):
         cyl_box.operator("cylsvg.add_cube_from_cyl", icon="MESH_CUBE")
         cyl_box.prop(p, "cube_obj", text="Base Cube")
 
+        # Import
+        box = layout.box()
+        box.label(text="Import SVG", icon="IMPORT")
+        row = box.row(align=True)
+        row.prop(p, "thk_value"); row.prop(p, "thk_unit", text="")
+        box.prop(p, "preserve_apparent_width")
+        box.operator("cylsvg.import_svg", icon="IMPORT")
+
         # Objects
         obj_box = layout.box()
         obj_box.label(text="Objects", icon="OUTLINER_OB_MESH")
         obj_box.prop(p, "flat_obj", text="SVG/Mesh")
 
-        layout.prop(p, "preserve_apparent_width")
         layout.operator("cylsvg.place_svg_on_cube_join", icon="AUTOMERGE_ON")
         layout.operator("cylsvg.cylindrify", icon="MOD_SIMPLEDEFORM")
         layout.separator()